@@ -368,10 +368,9 @@ class Grid:
                         right = wires[offset + len(box.dom)].start - 1
                         make_space(rows, right, max(0, stop - right + 1))
                     boxes.append(Cell(start, stop, box))
-                    rows[-1] = wires = wires[:offset]\
-                        + [Wire(start + 2 * j + 1, x)
-                           for j, x in enumerate(box.cod)]\
-                        + wires[offset + len(box.dom):]
+                    wires[offset:offset + len(box.dom)] = [
+                        Wire(start + 2 * j + 1, x)
+                        for j, x in enumerate(box.cod)]
                     offset += len(box.cod)
         result = Grid(make_boxes_as_small_as_possible(rows))
         return result - result.min
@@ -34,7 +34,9 @@ from math import sqrt
 from tempfile import NamedTemporaryFile, TemporaryDirectory
 
 import matplotlib.pyplot as plt
+import numpy as np
 from PIL import Image
+from matplotlib.collections import PathCollection
 from matplotlib.patches import PathPatch
 from matplotlib.path import Path
 
@@ -50,6 +52,7 @@ class Node:
         self.kind, self.data = kind, data
         for key, value in data.items():
             setattr(self, key, value)
+        self._hash = hash(repr(self))
 
     def __eq__(self, other):
         return isinstance(other, Node)\
@@ -63,7 +66,7 @@ class Node:
         return f"Node({repr(self.kind)}, {str_data})"
 
     def __hash__(self):
-        return hash(repr(self))
+        return self._hash
 
     __str__ = __repr__
 
@@ -124,10 +127,9 @@ def diagram2nx(diagram):
                 source = Node("dom", obj=source_obj, i=source_i, depth=depth)
                 target = Node("cod", obj=target_obj, i=target_i, depth=depth)
                 graph.add_edge(source, target)
-        return scan[:off]\
-            + [Node("cod", obj=obj, i=i, depth=depth)
-               for i, obj in enumerate(box.cod.inside)]\
-            + scan[off + len(box.dom):]
+        scan[off:off + len(box.dom)] = [
+            Node("cod", obj=obj, i=i, depth=depth)
+            for i, obj in enumerate(box.cod.inside)]
 
     def make_space(scan, box, off):
         if not scan:
@@ -166,7 +168,7 @@ def diagram2nx(diagram):
         scan.append(node)
     for depth, (box, off) in enumerate(zip(diagram.boxes, diagram.offsets)):
         x_pos = make_space(scan, box, off)
-        scan = add_box(scan, box, off, depth, x_pos)
+        add_box(scan, box, off, depth, x_pos)
     for i, obj in enumerate(diagram.cod.inside):
         node = Node("output", obj=obj, i=i)
         add_node(node, (pos[scan[i]][0], 0))
@@ -355,17 +357,30 @@ class TikzBackend(Backend):
 
 class MatBackend(Backend):
     """ Matplotlib drawing backend. """
+    wire_codes = np.array(
+        [Path.MOVETO, Path.CURVE3, Path.CURVE3], dtype=Path.code_type)
+
     def __init__(self, axis=None, figsize=None, linewidth=1):
         self.axis = axis or plt.subplots(figsize=figsize, facecolor='white')[1]
         self.linewidth = linewidth
+        self.wires = []  # The paths of the wires yet to be added to the axis.
         super().__init__()
 
+    def add_wires(self):
+        """ Adds the pending wires to the axis as one collection. """
+        if self.wires:
+            self.axis.add_collection(PathCollection(
+                self.wires, facecolors='none', edgecolors='black',
+                linewidths=self.linewidth))
+            self.wires = []
+
     def draw_text(self, text, i, j, **params):
         params['fontsize'] = params.get('fontsize', DEFAULT['fontsize'])
         self.axis.text(i, j, text, **params)
         super().draw_text(text, i, j, **params)
 
     def draw_node(self, i, j, **params):
+        self.add_wires()
         self.axis.scatter(
             [i], [j],
             c=COLORS[params.get("color", "black")],
@@ -375,9 +390,10 @@ class MatBackend(Backend):
         super().draw_node(i, j, **params)
 
     def draw_polygon(self, *points, color=DEFAULT["color"]):
-        codes = [Path.MOVETO]
-        codes += len(points[1:]) * [Path.LINETO] + [Path.CLOSEPOLY]
+        codes = np.full(len(points) + 1, Path.LINETO, dtype=Path.code_type)
+        codes[0], codes[-1] = Path.MOVETO, Path.CLOSEPOLY
         path = Path(points + points[:1], codes)
+        self.add_wires()
         self.axis.add_patch(PathPatch(
             path, facecolor=COLORS[color], linewidth=self.linewidth))
         super().draw_polygon(*points, color=color)
@@ -385,20 +401,19 @@ class MatBackend(Backend):
     def draw_wire(self, source, target,
                   bend_out=False, bend_in=False, style=None):
         if style == '->':  # pragma: no cover
+            self.add_wires()
             self.axis.arrow(
                 *(source + (target[0] - source[0], target[1] - source[1])),
                 head_width=.02, color="black")
         else:
             mid = (target[0], source[1])\
                 if bend_out else (source[0], target[1])
-            path = Path([source, mid, target],
-                        [Path.MOVETO, Path.CURVE3, Path.CURVE3])
-            self.axis.add_patch(PathPatch(
-                path, facecolor='none', linewidth=self.linewidth))
+            self.wires.append(Path([source, mid, target], self.wire_codes))
         super().draw_wire(source, target, bend_out=bend_out, bend_in=bend_in)
 
     def draw_spiders(self, graph, positions, draw_box_labels=True, **params):
         import networkx as nx
+        self.add_wires()
         nodes = {node for node in graph.nodes
                  if node.kind == "box" and node.box.draw_as_spider}
         shapes = {node: node.box.shape for node in nodes}
@@ -419,6 +434,7 @@ class MatBackend(Backend):
         xlim, ylim = params.get("xlim", None), params.get("ylim", None)
         margins = params.get("margins", DEFAULT['margins'])
         aspect = params.get("aspect", DEFAULT['aspect'])
+        self.add_wires()
         plt.margins(*margins)
         plt.subplots_adjust(
             top=1, bottom=0, right=1, left=0, hspace=0, wspace=0)
@@ -495,6 +511,13 @@ def draw(diagram, **params):
         'asymmetry', .25 * needs_asymmetry(diagram))
 
     def draw_wires(backend, graph, positions):
+        draw_type_labels = params.get('draw_type_labels', True)
+        draw_box_labels = params.get('draw_box_labels', True)
+        # Types that always_draw_label are labeled along with the boxes.
+        draw_labels = draw_type_labels or draw_box_labels
+        pad_i, pad_type = params.get('textpad', DEFAULT['textpad'])
+        fontsize_types = params.get(
+            'fontsize_types', params.get('fontsize', None))
         for source, target in graph.edges():
             def inside_a_box(node):
                 return node.kind == "box"\
@@ -529,18 +552,14 @@ def draw(diagram, **params):
                             target_position, [-1, 1], braid_shadow))
             backend.draw_wire(
                 source_position, target_position, bend_out, bend_in)
-            if source.kind in ["input", "cod"]\
-                    and (params.get('draw_type_labels', True)
-                         or getattr(source.obj, "always_draw_label", False)
-                         and params.get('draw_box_labels', True)):
+            if draw_labels and source.kind in ["input", "cod"]\
+                    and (draw_type_labels
+                         or getattr(source.obj, "always_draw_label", False)):
                 i, j = positions[source]
-                pad_i, pad_j = params.get('textpad', DEFAULT['textpad'])
-                pad_j = 0 if source.kind == "input" else pad_j
+                pad_j = 0 if source.kind == "input" else pad_type
                 backend.draw_text(
                     str(source.obj), i + pad_i, j - pad_j,
-                    fontsize=params.get('fontsize_types',
-                                        params.get('fontsize', None)),
-                    verticalalignment='top')
+                    fontsize=fontsize_types, verticalalignment='top')
         return backend
 
     def scale_and_pad(graph, pos, scale, pad):
@@ -736,7 +755,8 @@ class Equation:
         params['asymmetry'] = params.get(
             'asymmetry', .25 * needs_asymmetry(self))
         space = space or self.space
-        max_height = max(map(height, self.terms))
+        heights = list(map(height, self.terms))
+        max_height = max(heights)
         pad = params.get('pad', (0, 0))
         scale_x, scale_y = params.get('scale', (1, 1))
         backend = params['backend'] if 'backend' in params\
@@ -745,8 +765,8 @@ class Equation:
             if params.get('to_tikz', False)\
             else MatBackend(figsize=params.get('figsize', None))
 
-        for i, term in enumerate(self.terms):
-            scale = (scale_x, scale_y * max_height / height(term))
+        for i, (term, term_height) in enumerate(zip(self.terms, heights)):
+            scale = (scale_x, scale_y * max_height / term_height)
             term.draw(**dict(
                 params, show=False, path=None,
                 backend=backend, scale=scale, pad=pad))
@@ -31,6 +31,9 @@ Summary
         brute_force
 """
 
+from collections import deque
+from functools import lru_cache
+
 from discopy import messages, rigid, frobenius, messages
 from discopy.cat import factory, AxiomError
 from discopy.grammar import thue
@@ -105,21 +108,22 @@ class Diagram(frobenius.Diagram):
         ``word @ ... @ word >> wires`` by normalising words and wires
         seperately before combining them, so it can be drawn with :meth:`draw`.
         """
-        words, is_pregroup = self.id(), True
+        boxes, is_pregroup = [], True
         for _, box, right in self.inside:
             if isinstance(box, Word):
                 if right:  # word boxes should be tensored left to right.
                     is_pregroup = False
                     break
-                words = words @ box
+                boxes.append(box)
             else:
                 break
 
-        wires = self[len(words):]
-        is_pregroup = is_pregroup and all(
-            isinstance(box, (Cup, Cap, Swap)) for box in wires.boxes)
-        if not is_pregroup or not words.cod:
+        is_pregroup = is_pregroup and any(box.cod for box in boxes) and all(
+            isinstance(box, (Cup, Cap, Swap))
+            for _, box, _ in self.inside[len(boxes):])
+        if not is_pregroup:
             return rigid.Diagram.normal_form(self)
+        words, wires = self.id().tensor(*boxes), self[len(boxes):]
         return rigid.Diagram.normal_form(words)\
             >> rigid.Diagram.normal_form(wires)
 
@@ -218,36 +222,89 @@ class Functor(frobenius.Functor):
 def eager_parse(*words, target=Ty('s')):
     """
     Tries to parse a given list of words in an eager fashion.
+
+    Note
+    ----
+    The offsets of the cups are cached given the codomains of the words,
+    the diagram itself is built from the words given each time.
     """
-    result = Id(Ty()).tensor(*words)
-    scan = result.cod
-    while True:
-        fail = True
-        for i in range(len(scan) - 1):
-            if scan[i: i + 1].r != scan[i + 1: i + 2]:
-                continue
-            cup = Cup(scan[i: i + 1], scan[i + 1: i + 2])
-            result = result >> Id(scan[: i]) @ cup @ Id(scan[i + 2:])
-            scan, fail = result.cod, False
-            break
-        if result.cod == target:
-            return result
-        if fail:
-            raise NotImplementedError
+    sentence, layers = Id(Ty()).tensor(*words), []
+    cod = sentence.cod
+    for i in _eager_cups(tuple(word.cod for word in words), target):
+        left, right = cod[:i], cod[i + 2:]
+        layers.append(Diagram.layer_factory(
+            left, Cup(cod[i], cod[i + 1]), right))
+        cod = left @ right
+    return Diagram(
+        sentence.inside + tuple(layers), sentence.dom, cod, _scan=False)
+
+
+@lru_cache(maxsize=4096)
+def _eager_cups(cods, target):
+    """ The offsets of the cups found by :func:`eager_parse`. """
+    cod = Ty().tensor(*cods)
+    offsets, stack = [], []  # the prefix of cod where no cup can be found
+    for j, obj in enumerate(cod):
+        if not stack or stack[-1][1] != obj:
+            stack.append((obj, obj.r))
+            continue
+        stack.pop()
+        offsets.append(len(stack))
+        if len(stack) + len(cod) - j - 1 == len(target) and Ty().tensor(
+                *(x for x, _ in stack), cod[j + 1:]) == target:
+            return tuple(offsets)
+    if Ty().tensor(*(x for x, _ in stack)) != target:
+        raise NotImplementedError
+    return tuple(offsets)
 
 
 def brute_force(*vocab, target=Ty('s')):
     """
     Given a vocabulary, search for grammatical sentences.
     """
-    test = [()]
-    for words in test:
-        for word in vocab:
-            try:
-                yield eager_parse(*(words + (word, )), target=target)
-            except NotImplementedError:
-                pass
-            test.append(words + (word, ))
+    def adjoints(typ):
+        return tuple((obj, obj.r) for obj in typ)
+
+    def reduce(stack, permanent, cod):
+        for obj, obj_r in cod:
+            if stack and stack[-1][1] == obj:
+                stack = stack[:-1]
+                continue
+            stack += ((obj, obj_r), )
+            if obj_r not in cancelling:
+                permanent = len(stack)
+        return stack, permanent
+
+    # If no cup can be found in the target, eager_parse succeeds if and only
+    # if the cups it finds reduce the whole sentence to the target, so we
+    # can keep track of the reduced prefixes instead of parsing each time.
+    objects, queue = adjoints(target), deque([((), (), 0, 0)])
+    is_reduced = all(x_r != y for (_, x_r), (y, _) in zip(
+        objects, objects[1:]))
+    cods = [adjoints(word.cod) for word in vocab]
+    lengths = [len(cod) for cod in cods]
+    # An object whose right adjoint appears in no word can never be cancelled,
+    # so we can prune the prefixes where it is kept at the wrong position.
+    cancelling = {obj for cod in cods for obj, _ in cod}
+    while queue:
+        words, stack, permanent, length = queue.popleft()
+        for word, cod, n_objects in zip(vocab, cods, lengths):
+            sentence, total = words + (word, ), length + n_objects
+            reduced, kept = reduce(stack, permanent, cod)
+            if not is_reduced:
+                # Each cup of eager_parse removes two objects, and it finds
+                # at most the cups that reduce the sentence to its prefix.
+                if len(reduced) <= len(objects) <= total\
+                        and not (total - len(objects)) % 2:
+                    try:
+                        yield eager_parse(*sentence, target=target)
+                    except NotImplementedError:
+                        pass
+            elif reduced[:kept] != objects[:kept]:
+                continue
+            elif reduced == objects:
+                yield eager_parse(*sentence, target=target)
+            queue.append((sentence, reduced, kept, total))
 
 
 Diagram.braid_factory, Diagram.spider_factory = Swap, Spider
@@ -25,8 +25,11 @@ Summary
 
 from __future__ import annotations
 
+from collections import Counter
 from collections.abc import Callable, Mapping
+from functools import cached_property, lru_cache
 from inspect import isclass
+from itertools import accumulate, chain, count
 
 import random
 from typing import Any, Iterable, Union, TYPE_CHECKING
@@ -37,8 +40,6 @@ from networkx import (
     DiGraph as Graph,
     spring_layout,
     draw_networkx,
-    dag_longest_path_length,
-    weisfeiler_lehman_graph_hash,
 )
 from networkx.algorithms.isomorphism import is_isomorphic
 
@@ -64,6 +65,89 @@ if TYPE_CHECKING:
     from discopy.cat import Ty, Box, Diagram
 
 
+@lru_cache(maxsize=1024)
+def _plan_swaps(
+        wires: tuple[int, ...], n_dom: int, arities: tuple[tuple[int, int]],
+        offsets: tuple[int | None, ...]) -> tuple[tuple, tuple]:
+    """
+    Plan the swaps needed to draw a causal and monogamous hypergraph, given
+    only its wires, the length of its domain and the arities of its boxes.
+
+    Returns a pair ``(layers, swaps)`` with the swaps to apply before each box
+    together with its offset, then the swaps to apply before the codomain.
+    Each swap ``(left, middle, right)`` exchanges the wires ``left:middle``
+    with the wires ``middle:right``.
+
+    The plan only depends on the shape of the hypergraph, so it is cached
+    and shared between hypergraphs with the same wiring but other boxes.
+    """
+    scan, n_ports = list(wires[:n_dom]), n_dom
+    position = {spider: k for k, spider in enumerate(scan)}
+
+    def update(start, stop=None):
+        position.update(zip(scan[start:stop], count(start)))
+
+    layers = []
+    for (n_inputs, n_outputs), offset in zip(arities, offsets):
+        swaps = []
+        for i in range(n_inputs):
+            j = position[wires[n_ports + i]]
+            if i == 0 and offset is None:
+                offset = j
+            k = offset + i
+            if j != k:
+                swaps.append((k, j, j + 1) if j > k else (j, j + 1, k))
+                scan.insert(k - (j < k), scan.pop(j))
+                update(min(j, k), max(j + 1, k))
+                offset -= j < k
+        offset = 0 if offset is None else offset
+        for spider in scan[offset:offset + n_inputs]:
+            del position[spider]
+        scan[offset:offset + n_inputs] = wires[
+            n_ports + n_inputs:n_ports + n_inputs + n_outputs]
+        update(offset)
+        layers.append((tuple(swaps), offset))
+        n_ports += n_inputs + n_outputs
+    swaps = []
+    for i, spider in enumerate(wires[n_ports:]):
+        j = position[spider]
+        if i < j:
+            swaps.append((i, j, j + 1))
+            scan.insert(i, scan.pop(j))
+            update(i, j + 1)
+    return tuple(layers), tuple(swaps)
+
+
+def _plan_merges(
+        wires: tuple[int, ...], port_is_input: list[bool],
+        port_depths: list[int], n_spiders: int) -> tuple[list[int], list]:
+    """
+    Plan the merges needed to make a hypergraph polygynous, given only its
+    wires, the direction and depth of each port and its number of spiders.
+
+    Returns the new wires and a list of triples ``(depth, spider, legs)``, one
+    for each merging spider box to insert at ``depth`` with ``legs`` as fresh
+    input spiders and ``spider`` as output.
+    """
+    inputs = [[] for _ in range(n_spiders)]
+    has_outputs = [False] * n_spiders
+    for port, (spider, is_input) in enumerate(zip(wires, port_is_input)):
+        if is_input:
+            inputs[spider].append(port)
+        else:
+            has_outputs[spider] = True
+    wires, merges, fresh = list(wires), [], count(n_spiders)
+    for spider, ports in enumerate(inputs):
+        if len(ports) == 1 or not ports and not has_outputs[spider]:
+            continue
+        depth = port_depths[ports[-1]] + 1 if ports else 0
+        legs = [next(fresh) for _ in ports]
+        for port, leg in zip(ports, legs):
+            wires[port] = leg
+        merges.append((depth, spider, legs))
+    return wires, merges
+
+
 class Hypergraph(Composable, Whiskerable, NamedGeneric['category', 'functor']):
     """
     A hypergraph is given by a domain, a codomain, a list of boxes, a list of
@@ -157,30 +241,58 @@ class Hypergraph(Composable, Whiskerable, NamedGeneric['category', 'functor']):
             assert_isinstance(box, self.category.ar)
         assert_isinstance(wires, tuple)
         self.dom, self.cod, self.boxes = dom, cod, boxes
-        if len(wires) != len(self.ports):
+        port_types = self._port_types
+        if len(wires) != len(port_types):
             raise ValueError
         if spider_types is None:
-            spider_types = {
-                spider: port.obj for spider, port in zip(wires, self.ports)}
+            spider_types = dict(zip(wires, port_types))
         if not isinstance(spider_types, Mapping):
             spider_types = dict(enumerate(spider_types))
-        relabeling = sorted(set(wires), key=wires.index)
-        relabeling += sorted(set(spider_types) - set(relabeling))
-        self.wires = tuple(relabeling.index(s) for s in wires)
+        relabeling = list(dict.fromkeys(wires))
+        relabeling += sorted(set(spider_types).difference(relabeling))
+        if all(isinstance(s, int) and s == i
+               for i, s in enumerate(relabeling)):
+            self.wires = wires
+        else:
+            index = {spider: i for i, spider in enumerate(relabeling)}
+            self.wires = tuple(index[s] for s in wires)
         self.spider_types = tuple(map(
             lambda typ: typ.r if getattr(typ, "z", 0) else typ,
             [spider_types[s] for s in relabeling]))
         for obj in self.spider_types:
             assert_isatomic(obj, self.category.ob)
-        for obj, wires in zip(self.spider_types, self.spider_wires):
-            adjoint = getattr(obj, "r", obj)
-            for i in set.union(*wires):
-                if self.ports[i].obj not in [obj, adjoint]:
-                    raise AxiomError(messages.TYPE_ERROR.format(
-                        obj, self.ports[i].obj))
+        for spider, port_type in zip(self.wires, port_types):
+            obj = self.spider_types[spider]
+            if port_type not in (obj, getattr(obj, "r", obj)):
+                raise AxiomError(messages.TYPE_ERROR.format(obj, port_type))
         self.offsets = offsets or tuple(len(boxes) * [None])
 
-    @property
+    @classmethod
+    def _from_validated(
+            cls, dom: Ty, cod: Ty, boxes: tuple[Box, ...],
+            wires: tuple[int, ...], spider_types: tuple[Ty, ...],
+            offsets: tuple[int | None, ...]) -> Hypergraph:
+        """
+        Construct a hypergraph without type checking, this assumes the
+        spiders are ``range(len(spider_types))`` with types already checked,
+        as is the case when permuting or composing valid hypergraphs.
+
+        The spiders are still relabeled in order of first appearance.
+        """
+        index = {}
+        wires = tuple(index.setdefault(s, len(index)) for s in wires)
+        for spider in range(len(spider_types)):
+            index.setdefault(spider, len(index))
+        relabeled_types = len(spider_types) * [None]
+        for spider, i in index.items():
+            relabeled_types[i] = spider_types[spider]
+        result = object.__new__(cls)
+        result.dom, result.cod, result.boxes = dom, cod, boxes
+        result.wires, result.spider_types = wires, tuple(relabeled_types)
+        result.offsets = offsets
+        return result
+
+    @cached_property
     def box_wires(self) -> list[tuple[tuple[int, ...], tuple[int, ...]]]:
         """
         The wires connecting the boxes of a hypergraph.
@@ -203,15 +315,22 @@ class Hypergraph(Composable, Whiskerable, NamedGeneric['category', 'functor']):
         ((0,), (1, 2))
         ((1, 2), (3,))
         """
-        result, i = [], len(self.dom)
-        for box in self.boxes:
-            dom_wires = self.wires[i:i + len(box.dom)]
-            cod_wires = self.wires[i + len(box.dom):i + len(box.dom @ box.cod)]
-            result.append((dom_wires, cod_wires))
-            i += len(box.dom @ box.cod)
-        return result
+        return [
+            (self.wires[i:i + len(box.dom)], self.wires[i + len(box.dom):j])
+            for box, i, j in zip(
+                self.boxes, self._box_offsets, self._box_offsets[1:])]
+
+    @cached_property
+    def _box_offsets(self) -> list[int]:
+        """
+        The index of the first port of each box, followed by the index of the
+        first output port, i.e. the prefix sums of the box arities.
+        """
+        return list(accumulate(
+            (len(box.dom) + len(box.cod) for box in self.boxes),
+            initial=len(self.dom)))
 
-    @property
+    @cached_property
     def spider_wires(self) -> list[tuple[set[int], set[int]]]:
         """
         The input and output wires for each spider of a hypergraph.
@@ -227,21 +346,43 @@ class Hypergraph(Composable, Whiskerable, NamedGeneric['category', 'functor']):
         ({2}, {3, 4})
         """
         result = [(set(), set()) for _ in range(self.n_spiders)]
-        for port, spider in enumerate(self.wires[:len(self.dom)]):
-            result[spider][0].add(port)
-        n_ports = len(self.dom)
-        for dom_wires, cod_wires in self.box_wires:
-            for port, spider in enumerate(dom_wires):
-                result[spider][1].add(port + n_ports)
-            for port, spider in enumerate(cod_wires):
-                result[spider][0].add(port + n_ports + len(dom_wires))
-            n_ports += len(dom_wires + cod_wires)
-        output_wires = self.wires[len(self.wires) - len(self.cod):]
-        for port, spider in enumerate(output_wires):
-            result[spider][1].add(port + n_ports)
+        for port, (spider, is_input) in enumerate(
+                zip(self.wires, self._port_is_input)):
+            result[spider][0 if is_input else 1].add(port)
         return result
 
-    @property
+    @cached_property
+    def _port_is_input(self) -> list[bool]:
+        """
+        Whether each port is an input of its spider, i.e. a domain port of
+        the hypergraph or a codomain port of a box.
+        """
+        return [True] * len(self.dom) + [
+            is_input for box in self.boxes
+            for typ, is_input in [(box.dom, False), (box.cod, True)]
+            for _ in typ] + [False] * len(self.cod)
+
+    @cached_property
+    def _spider_port_stats(self) -> tuple[list[int], ...]:
+        """
+        The number of input and output wires of each spider, together with
+        the index of its first input and output wire (or ``len(self.wires)``).
+
+        This is computed in one pass without building :attr:`spider_wires`.
+        """
+        n_inputs, n_outputs = [0] * self.n_spiders, [0] * self.n_spiders
+        first_inputs = [len(self.wires)] * self.n_spiders
+        first_outputs = [len(self.wires)] * self.n_spiders
+        for port, (spider, is_input) in enumerate(
+                zip(self.wires, self._port_is_input)):
+            counts, firsts = (n_inputs, first_inputs) if is_input\
+                else (n_outputs, first_outputs)
+            if not counts[spider]:
+                firsts[spider] = port
+            counts[spider] += 1
+        return n_inputs, n_outputs, first_inputs, first_outputs
+
+    @cached_property
     def ports(self):
         """
         The ports in a diagram.
@@ -265,24 +406,54 @@ class Hypergraph(Composable, Whiskerable, NamedGeneric['category', 'functor']):
         """
         inputs = [Node("input", i=i, obj=obj)
                   for i, obj in enumerate(self.dom)]
-        doms_and_cods = sum([[
+        doms_and_cods = [
             Node(kind, depth=depth, i=i, obj=obj)
-            for i, obj in enumerate(typ)]
             for depth, box in enumerate(self.boxes)
-            for kind, typ in [("dom", box.dom), ("cod", box.cod)]], [])
+            for kind, typ in [("dom", box.dom), ("cod", box.cod)]
+            for i, obj in enumerate(typ)]
         outputs = [Node("output", i=i, obj=obj)
                    for i, obj in enumerate(self.cod)]
         return inputs + doms_and_cods + outputs
 
-    @property
+    @cached_property
+    def _port_depths(self) -> list[int]:
+        """
+        The depth of the box of each port, without building :meth:`ports`,
+        with ``-1`` for inputs and ``len(self.boxes)`` for outputs.
+        """
+        return [-1] * len(self.dom) + [
+            depth for depth, box in enumerate(self.boxes)
+            for _ in range(len(box.dom) + len(box.cod))
+        ] + [len(self.boxes)] * len(self.cod)
+
+    @cached_property
+    def _port_types(self) -> list[Ty]:
+        """ The type of each port, without building :meth:`ports`. """
+        return list(chain(self.dom, chain.from_iterable(
+            chain(box.dom, box.cod) for box in self.boxes), self.cod))
+
+    @cached_property
     def n_spiders(self):
         """ The number of spiders in a hypergraph diagram. """
         return len(self.spider_types)
 
-    @property
+    @cached_property
     def scalar_spiders(self):
         """ The zero-legged spiders in a hypergraph diagram. """
-        return [i for i in range(self.n_spiders) if not self.wires.count(i)]
+        return [i for i in range(self.n_spiders) if not self._wire_counts[i]]
+
+    @cached_property
+    def _wire_counts(self) -> Counter:
+        """ The number of ports connected to each spider. """
+        return Counter(self.wires)
+
+    @cached_property
+    def _ports_by_spider(self) -> dict[int, list[int]]:
+        """ The ports connected to each non-scalar spider, in order. """
+        result = {}
+        for port, spider in enumerate(self.wires):
+            result.setdefault(spider, []).append(port)
+        return result
 
     @classmethod
     def id(cls, dom=None) -> Hypergraph:
@@ -310,24 +481,23 @@ class Hypergraph(Composable, Whiskerable, NamedGeneric['category', 'functor']):
             left[i]: t for i, t in enumerate(self.spider_types)}
         spider_types.update({
             right[i]: t for i, t in enumerate(other.spider_types)})
-        return type(self)(dom, cod, boxes, tuple(wires), spider_types, offsets)
+        spider_types = tuple(spider_types[i] for i in range(len(spider_types)))
+        return self._from_validated(
+            dom, cod, boxes, tuple(wires), spider_types, offsets)
 
     @unbiased
     def tensor(self, other: Hypergraph):
         """ Tensor of two hypergraph diagrams, i.e. their disjoint union. """
         dom, cod = self.dom @ other.dom, self.cod @ other.cod
         boxes, offsets = self.boxes + other.boxes, self.offsets + other.offsets
-        dom_wires = self.wires[:len(self.dom)] + tuple(
-            self.n_spiders + i for i in other.wires[:len(other.dom)])
-        box_wires = self.wires[len(self.dom):-len(self.cod) or len(self.wires)]
-        box_wires += tuple(self.n_spiders + i for i in other.wires[
-            len(other.dom):-len(other.cod) or len(other.wires)])
-        cod_wires = self.wires[len(self.wires) - len(self.cod):] + tuple(
-            self.n_spiders + i
-            for i in other.wires[len(other.wires) - len(other.cod):])
-        wires = dom_wires + box_wires + cod_wires
+        i, j = len(self.dom), len(self.wires) - len(self.cod)
+        k, m = len(other.dom), len(other.wires) - len(other.cod)
+        other_wires = [self.n_spiders + spider for spider in other.wires]
+        wires = tuple(chain(
+            self.wires[:i], other_wires[:k], self.wires[i:j],
+            other_wires[k:m], self.wires[j:], other_wires[m:]))
         spiders = self.spider_types + other.spider_types
-        return type(self)(dom, cod, boxes, wires, spiders, offsets)
+        return self._from_validated(dom, cod, boxes, wires, spiders, offsets)
 
     def dagger(self):
         """
@@ -345,12 +515,12 @@ class Hypergraph(Composable, Whiskerable, NamedGeneric['category', 'functor']):
         dom, cod = self.cod, self.dom
         boxes = tuple(box.dagger() for box in self.boxes[::-1])
         dom_wires = self.wires[len(self.wires) - len(self.cod):]
-        box_wires = sum([
+        box_wires = tuple(chain.from_iterable(
             cod_wires + dom_wires
-            for dom_wires, cod_wires in self.box_wires[::-1]], ())
+            for dom_wires, cod_wires in self.box_wires[::-1]))
         cod_wires = self.wires[:len(self.dom)]
         wires = dom_wires + box_wires + cod_wires
-        return type(self)(
+        return self._from_validated(
             dom, cod, boxes, wires, self.spider_types, self.offsets[::-1])
 
     @classmethod
@@ -407,12 +577,12 @@ class Hypergraph(Composable, Whiskerable, NamedGeneric['category', 'functor']):
         dom, cod = (x.l if left else x.r for x in (self.cod, self.dom))
         boxes = tuple(box.l if left else box.r for box in self.boxes[::-1])
         dom_wires = self.wires[len(self.wires) - len(self.cod):][::-1]
-        box_wires = sum([
+        box_wires = tuple(chain.from_iterable(
             cod_wires[::-1] + dom_wires[::-1]
-            for dom_wires, cod_wires in self.box_wires[::-1]], ())
+            for dom_wires, cod_wires in self.box_wires[::-1]))
         cod_wires = self.wires[:len(self.dom)][::-1]
         wires = dom_wires + box_wires + cod_wires
-        return type(self)(
+        return self._from_validated(
             dom, cod, boxes, wires, self.spider_types, self.offsets[::-1])
 
     l = property(lambda self: self.rotate(left=True))
@@ -484,11 +654,11 @@ class Hypergraph(Composable, Whiskerable, NamedGeneric['category', 'functor']):
         boxes, offsets = tuple(boxes), tuple(offsets)
         box_wires = list(self.box_wires)
         box_wires[i], box_wires[j] = box_wires[j], box_wires[i]
-        box_wires = sum([c + d for c, d in box_wires], ())
+        box_wires = tuple(chain.from_iterable(c + d for c, d in box_wires))
         dom_wires = self.wires[:len(self.dom)]
         cod_wires = self.wires[len(self.wires) - len(self.cod):]
         wires = dom_wires + box_wires + cod_wires
-        return type(self)(
+        return self._from_validated(
             self.dom, self.cod, boxes, wires, self.spider_types, offsets)
 
     def simplify(self) -> Hypergraph:
@@ -504,12 +674,18 @@ class Hypergraph(Composable, Whiskerable, NamedGeneric['category', 'functor']):
         >>> g = Box('g', x, Ty()).to_hypergraph()
         >>> assert (f >> g).interchange(0, 1).simplify() == f >> g
         """
-        for i in range(len(self.boxes)):
-            for j in range(len(self.boxes)):
-                result = self.interchange(i, j)
-                if len(result.to_diagram()) < len(self.to_diagram()):
-                    return result.simplify()
-        return self
+        result, length = self, len(self.to_diagram())
+        pairs = [(i, j) for i in range(len(self.boxes))
+                 for j in range(i + 1, len(self.boxes))]
+        while True:
+            for i, j in pairs:
+                candidate = result.interchange(i, j)
+                candidate_length = len(candidate.to_diagram())
+                if candidate_length < length:
+                    result, length = candidate, candidate_length
+                    break
+            else:
+                return result
 
     def __getitem__(self, key):
         if key == slice(None, None, -1):
@@ -519,12 +695,57 @@ class Hypergraph(Composable, Whiskerable, NamedGeneric['category', 'functor']):
     def __eq__(self, other: Any):
         if not isinstance(other, Hypergraph):
             return False
-        return self.is_parallel(other) and is_isomorphic(
-            self.to_graph(), other.to_graph(), lambda x, y: x == y)
+        if (len(self.boxes), len(self.wires), self.n_spiders) != (
+                len(other.boxes), len(other.wires), other.n_spiders):
+            return False
+        if not self.is_parallel(other):
+            return False
+        if self.boxes == other.boxes and self.wires == other.wires:
+            return True
+        return is_isomorphic(self._graph, other._graph, lambda x, y: x == y)
 
     def __hash__(self):
-        return hash((self.dom, self.cod, weisfeiler_lehman_graph_hash(
-            self.to_graph(), node_attr="box")))
+        return hash((self.dom, self.cod, self._wl_hash))
+
+    @cached_property
+    def _graph(self) -> Graph:
+        """ The result of :meth:`to_graph`, used to check isomorphism. """
+        return self.to_graph()
+
+    @cached_property
+    def _wl_hash(self) -> int:
+        """
+        A Weisfeiler-Lehman hash with boxes labeled by :code:`str` and three
+        rounds of refinement, computed from the wires without :meth:`to_graph`.
+        """
+        box_labels = [str(box) for box in self.boxes]
+        spider_labels = self.n_spiders * [None]
+        input_wires = self.wires[:len(self.dom)]
+        output_wires = self.wires[len(self.wires) - len(self.cod):]
+        for _ in range(3):
+            neighbours = [[] for _ in range(self.n_spiders)]
+            for i, spider in enumerate(input_wires):
+                neighbours[spider].append(("input", i))
+            for i, spider in enumerate(output_wires):
+                neighbours[spider].append(("output", i))
+            for label, (dom_wires, cod_wires) in zip(
+                    box_labels, self.box_wires):
+                for kind, wires in [("dom", dom_wires), ("cod", cod_wires)]:
+                    for j, spider in enumerate(wires):
+                        neighbours[spider].append((kind, j, label))
+            box_labels = [hash((
+                label,
+                tuple(spider_labels[spider] for spider in dom_wires),
+                tuple(spider_labels[spider] for spider in cod_wires)))
+                for label, (dom_wires, cod_wires) in zip(
+                    box_labels, self.box_wires)]
+            spider_labels = [
+                hash((label, tuple(sorted(edges))))
+                for label, edges in zip(spider_labels, neighbours)]
+        return hash((
+            tuple(sorted(box_labels)), tuple(sorted(spider_labels)),
+            tuple(spider_labels[spider] for spider in input_wires),
+            tuple(spider_labels[spider] for spider in output_wires)))
 
     def __repr__(self):
         spider_types = f", spider_types={self.spider_types}"\
@@ -537,7 +758,7 @@ class Hypergraph(Composable, Whiskerable, NamedGeneric['category', 'functor']):
     def __str__(self):
         return str(self.to_diagram())
 
-    @property
+    @cached_property
     def bijection(self):
         """
         Bijection between ports.
@@ -565,13 +786,11 @@ class Hypergraph(Composable, Whiskerable, NamedGeneric['category', 'functor']):
         if not self.is_bijective:
             raise ValueError
         result = {}
-        for source, spider in enumerate(self.wires):
-            if spider in self.wires[source + 1:]:
-                target = self.wires[source + 1:].index(spider) + source + 1
-                result[source], result[target] = target, source
+        for source, target in self._ports_by_spider.values():
+            result[source], result[target] = target, source
         return [result[source] for source in sorted(result)]
 
-    @property
+    @cached_property
     def is_bijective(self) -> bool:
         """
         Checks bijectivity, i.e. each spider is connected to two or zero ports.
@@ -588,10 +807,9 @@ class Hypergraph(Composable, Whiskerable, NamedGeneric['category', 'functor']):
         >>> assert H.spiders(0, 0, x).is_bijective
         >>> assert not H.spiders(1, 2, x).is_bijective
         """
-        return all(
-            self.wires.count(i) in [0, 2] for i in range(self.n_spiders))
+        return all(n == 2 for n in self._wire_counts.values())
 
-    @property
+    @cached_property
     def is_monogamous(self) -> bool:
         """
         Checks monogamy, i.e. each input connects to exactly one output,
@@ -623,22 +841,23 @@ class Hypergraph(Composable, Whiskerable, NamedGeneric['category', 'functor']):
         >>> assert not H.spiders(1, 2, x).is_monogamous
         >>> assert not H.spiders(2, 3, x).is_monogamous
         """
-        for input_wires, output_wires in self.spider_wires:
-            if len(input_wires) != len(output_wires):
-                return False
-            if len(input_wires) + len(output_wires) not in [0, 2]:
-                return False
-        return True
+        n_inputs, n_outputs, _, _ = self._spider_port_stats
+        return all(
+            n_out == n_in <= 1
+            for n_in, n_out in zip(n_inputs, n_outputs))
 
-    @property
+    @cached_property
     def is_polygynous(self) -> bool:
         """
         Checks polygyny, i.e. if each non-scalar spider is connected to exactly
         one output port.
         """
-        return all(len(x) == 1 for x, y in self.spider_wires if x.union(y))
+        n_inputs, n_outputs, _, _ = self._spider_port_stats
+        return all(
+            n_in == 1 for n_in, n_out in zip(n_inputs, n_outputs)
+            if n_in or n_out)
 
-    @property
+    @cached_property
     def is_causal(self) -> bool:
         """
         Checks causality, i.e. if each spider is connected to exactly one
@@ -665,9 +884,11 @@ class Hypergraph(Composable, Whiskerable, NamedGeneric['category', 'functor']):
 
         >>> assert not H.cups(x, x).is_causal
         """
-        return all(len(input_wires) == 1 and all(
-            u < v for u in input_wires for v in output_wires)
-            for input_wires, output_wires in self.spider_wires)
+        n_inputs, _, first_inputs, first_outputs = self._spider_port_stats
+        return all(
+            n_in == 1 and first_in < first_out
+            for n_in, first_in, first_out in zip(
+                n_inputs, first_inputs, first_outputs))
 
     def make_bijective(self) -> Hypergraph:
         """
@@ -687,36 +908,44 @@ class Hypergraph(Composable, Whiskerable, NamedGeneric['category', 'functor']):
         >>> unit = H.spiders(0, 1, Ty('x', 'y')).make_bijective()
         >>> assert unit.boxes == (Spider(0, 1, Ty('y')), Spider(0, 1, Ty('x')))
         """
-        boxes = list(self.boxes)
-        wires = list(self.wires)
-        spider_types = list(self.spider_types)
+        if self.is_bijective:
+            return self
+        wires, spider_types = list(self.wires), dict(enumerate(
+            self.spider_types))
+        fresh, start, end = count(self.n_spiders), [], []
+        before, after = [[] for _ in self.boxes], [[] for _ in self.boxes]
         for spider, (typ, (input_wires, output_wires)) in reversed(list(
-                enumerate(zip(spider_types, self.spider_wires)))):
-            n_legs = len(input_wires) + len(output_wires)
-            if n_legs in [0, 2]:
+                enumerate(zip(self.spider_types, self.spider_wires)))):
+            if len(input_wires) + len(output_wires) in (0, 2):
                 continue
+            box = self.category.ar.spider_factory(
+                len(input_wires), len(output_wires), typ)
+            legs = []
+            for port in sorted(input_wires) + sorted(output_wires):
+                wires[port] = next(fresh)
+                spider_types[wires[port]] = typ
+                legs.append(wires[port])
+            del spider_types[spider]
             if input_wires:
-                node = self.ports[max(input_wires)]
-                depth = 0 if node.kind == "input" else node.depth + 1
+                depth = self._port_depths[max(input_wires)]
+                layer = start if depth < 0 else after[depth]
+                layer.insert(0, (box, None, legs))
             else:
-                node = self.ports[min(output_wires)]
-                depth = len(boxes) if node.kind == "output" else node.depth
-            boxes = boxes[:depth] + [self.category.ar.spider_factory(
-                len(input_wires), len(output_wires), typ)] + boxes[depth:]
-            offsets = self.offsets[:depth] + (None, ) + self.offsets[depth:]
-            for j, port in enumerate(input_wires.union(output_wires)):
-                wires[port] = len(spider_types) + j
-            i = len(self.dom) + len(
-                sum([sum(wires, ()) for wires in self.box_wires[:depth]], ()))
-            wires = wires[:i] + list(range(
-                len(spider_types), len(spider_types) + n_legs)) + wires[i:]
-            spider_types += n_legs * [typ]
-            del spider_types[spider]
-            wires = [w - 1 if w > spider else w for w in wires]
-            return type(self)(
-                self.dom, self.cod, tuple(boxes),
-                tuple(wires), spider_types, offsets).make_bijective()
-        return self
+                depth = self._port_depths[min(output_wires)]
+                layer = end if depth == len(self.boxes) else before[depth]
+                layer.append((box, None, legs))
+        layers = start
+        for depth, (box, offset) in enumerate(zip(self.boxes, self.offsets)):
+            i, j = self._box_offsets[depth:depth + 2]
+            layers += before[depth] + [(box, offset, wires[i:j])]
+            layers += after[depth]
+        layers += end
+        boxes, offsets, box_wires = zip(*layers)
+        wires = tuple(chain(
+            wires[:len(self.dom)], chain.from_iterable(box_wires),
+            wires[self._box_offsets[-1]:]))
+        return type(self)(
+            self.dom, self.cod, boxes, wires, spider_types, offsets)
 
     def make_monogamous(self) -> Hypergraph:
         """
@@ -732,41 +961,36 @@ class Hypergraph(Composable, Whiskerable, NamedGeneric['category', 'functor']):
         """
         if not self.is_bijective:
             return self.make_bijective().make_monogamous()
-        for kinds, cups_or_caps in [
-                (["input", "cod"], "cups"),
-                (["dom", "output"], "caps")]:
-            for source, spider in [
-                    (source, spider) for source, (spider, port)
-                    in enumerate(zip(self.wires, self.ports))
-                    if port.kind in kinds]:
-                if spider not in self.wires[source + 1:]:
+        wires, spider_types = list(self.wires), dict(enumerate(
+            self.spider_types))
+        fresh, caps, cups = count(self.n_spiders), [], []
+        for kinds, layers in [
+                (("input", "cod"), cups), (("dom", "output"), caps)]:
+            for spider, (source, target) in sorted(
+                    self._ports_by_spider.items(), key=lambda item: item[1]):
+                if self.ports[source].kind not in kinds\
+                        or self.ports[target].kind not in kinds:
                     continue
-                target = self.wires[source + 1:].index(spider) + source + 1
-                if self.ports[target].kind in kinds:
-                    spider_types = dict(enumerate(self.spider_types))
-                    typ = spider_types[spider]
-                    left, right = len(spider_types), len(spider_types) + 1
-                    wires = list(self.wires)
-                    wires[source], wires[target] = left, right
-                    if cups_or_caps == "cups":
-                        boxes = self.boxes + (
-                            self.category.ar.cup_factory(typ, typ), )
-                        offsets = self.offsets + (None, )
-                        wires = wires[:len(wires) - len(self.cod)] + [
-                            left, right] + wires[len(wires) - len(self.cod):]
-                    else:
-                        boxes = (self.category.ar.cap_factory(typ, typ),
-                                 ) + self.boxes
-                        offsets = (None, ) + self.offsets
-                        wires = wires[:len(self.dom)] + [
-                            left, right] + wires[len(self.dom):]
-                    wires = tuple(wires)
-                    spider_types[left] = spider_types[right] = typ
-                    del spider_types[spider]
-                    return type(self)(
-                        self.dom, self.cod, boxes, wires, spider_types, offsets
-                    ).make_monogamous()
-        return self
+                typ = spider_types.pop(spider)
+                left, right = next(fresh), next(fresh)
+                wires[source], wires[target] = left, right
+                spider_types[left] = spider_types[right] = typ
+                factory = self.category.ar.cup_factory if layers is cups\
+                    else self.category.ar.cap_factory
+                layers.append((factory(typ, typ), (left, right)))
+        if not cups and not caps:
+            return self
+        caps.reverse()
+        boxes = tuple(box for box, _ in caps) + self.boxes + tuple(
+            box for box, _ in cups)
+        offsets = len(caps) * (None, ) + self.offsets + len(cups) * (None, )
+        n_cod = len(self.wires) - len(self.cod)
+        wires = tuple(chain(
+            wires[:len(self.dom)], *(legs for _, legs in caps),
+            wires[len(self.dom):n_cod], *(legs for _, legs in cups),
+            wires[n_cod:]))
+        return type(self)(
+            self.dom, self.cod, boxes, wires, spider_types, offsets)
 
     def make_polygynous(self) -> Hypergraph:
         """
@@ -779,29 +1003,28 @@ class Hypergraph(Composable, Whiskerable, NamedGeneric['category', 'functor']):
         >>> assert h.boxes == (Spider(2, 1, Ty('x')), )
         >>> assert h.wires == (0, 1) + (0, 1, 2) + (2, 2, 2)
         """
-        for spider, (typ, (input_wires, output_wires)) in enumerate(
-                zip(self.spider_types, self.spider_wires)):
-            n_legs = len(input_wires) + len(output_wires)
-            if len(input_wires) == 1:
-                continue
-            depth = getattr(self.ports[max(input_wires)], "depth", -1) + 1\
-                if input_wires else 0
-            boxes = self.boxes[:depth] + (self.category.ar.spider_factory(
-                len(input_wires), 1, typ), ) + self.boxes[depth:]
-            offsets = self.offsets[:depth] + (None, ) + self.offsets[depth:]
-            wires = list(self.wires)
-            for j, port in enumerate(input_wires):
-                wires[port] = self.n_spiders + j
-            i = len(self.dom) + len(
-                sum([sum(wires, []) for wires in self.box_wires[:depth]], []))
-            wires = wires[:i] + list(range(
-                self.n_spiders, self.n_spiders + len(input_wires))
-            ) + [spider] + wires[i:]
-            spider_types = self.spider_types + len(input_wires) * (typ, )
-            return type(self)(
-                self.dom, self.cod, boxes, tuple(wires), spider_types, offsets
-            ).make_polygynous()
-        return self
+        if self.is_polygynous:
+            return self
+        wires, merges = _plan_merges(
+            self.wires, self._port_is_input, self._port_depths,
+            self.n_spiders)
+        spider_types = list(self.spider_types)
+        layers = [[] for _ in range(len(self.boxes) + 1)]
+        for depth, spider, legs in merges:
+            typ = self.spider_types[spider]
+            spider_types += len(legs) * [typ]
+            layers[depth].append((self.category.ar.spider_factory(
+                len(legs), 1, typ), None, legs + [spider]))
+        result = layers[0]
+        for depth, (box, offset) in enumerate(zip(self.boxes, self.offsets)):
+            i, j = self._box_offsets[depth:depth + 2]
+            result += [(box, offset, wires[i:j])] + layers[depth + 1]
+        boxes, offsets, box_wires = zip(*result)
+        wires = tuple(chain(
+            wires[:len(self.dom)], chain.from_iterable(box_wires),
+            wires[self._box_offsets[-1]:]))
+        return type(self)(
+            self.dom, self.cod, boxes, wires, spider_types, offsets)
 
     def make_causal(self) -> Hypergraph:
         """
@@ -818,36 +1041,39 @@ class Hypergraph(Composable, Whiskerable, NamedGeneric['category', 'functor']):
         >>> from discopy.frobenius import Hypergraph as H, Spider
         >>> assert H.spiders(2, 1, x).make_causal().boxes\\
         ...     == (Spider(2, 1, x),)
+        >>> assert f.make_causal() is f
         """
+        if self.is_causal:
+            return self
         if not self.is_polygynous:
             return self.make_polygynous().make_causal()
-        for input_spider, (typ, (input_wires, output_wires)) in enumerate(
-                zip(self.spider_types, self.spider_wires)):
-            if not input_wires:
-                assert not output_wires
-                dom, cod = self.dom @ typ, self.cod @ typ
-                wires = list(self.wires)
-                wires = wires[:len(self.dom)] + [input_spider]\
-                    + wires[len(self.dom):] + [input_spider]
-                boxes, wires = self.boxes, tuple(wires)
-                arg = type(self)(
-                    dom, cod, boxes, wires, self.spider_types, self.offsets)
-                return arg.make_causal().explicit_trace()
-            input_wire, = input_wires
-            for output_wire in output_wires:
-                if output_wire < input_wire:
-                    dom, cod = self.dom @ typ, self.cod @ typ
-                    spider_types = self.spider_types + (typ, )
-                    output_spider = len(spider_types) - 1
-                    wires = list(self.wires)
-                    wires[output_wire] = output_spider
-                    wires = wires[:len(self.dom)] + [output_spider]\
-                        + wires[len(self.dom):] + [input_spider]
-                    boxes, wires = self.boxes, tuple(wires)
-                    arg = type(self)(
-                        dom, cod, boxes, wires, spider_types, self.offsets)
-                    return arg.make_causal().explicit_trace()
-        return self
+        wires, spider_types = list(self.wires), list(self.spider_types)
+        traced = []
+        n_inputs, _, first_inputs, first_outputs = self._spider_port_stats
+        for input_spider, typ in enumerate(self.spider_types):
+            if not n_inputs[input_spider]:
+                traced.append((typ, input_spider, input_spider))
+                continue
+            input_wire = first_inputs[input_spider]
+            if first_outputs[input_spider] > input_wire:
+                continue
+            _, output_wires = self.spider_wires[input_spider]
+            for output_wire in sorted(output_wires):
+                if output_wire > input_wire:
+                    break
+                wires[output_wire] = output_spider = len(spider_types)
+                traced.append((typ, output_spider, input_spider))
+                spider_types.append(typ)
+        types = [typ for typ, _, _ in traced]
+        dom, cod = self.dom.tensor(*types), self.cod.tensor(*types)
+        wires = tuple(chain(
+            wires[:len(self.dom)], (spider for _, spider, _ in traced),
+            wires[len(self.dom):], (spider for _, _, spider in traced)))
+        result = type(self)(
+            dom, cod, self.boxes, wires, spider_types, self.offsets)
+        for _ in traced:
+            result = result.explicit_trace()
+        return result
 
     @classmethod
     def from_box(cls, box: Box) -> Hypergraph:
@@ -892,10 +1118,73 @@ class Hypergraph(Composable, Whiskerable, NamedGeneric['category', 'functor']):
         ...           H.spiders(1, 2, x @ y)]:
         ...     assert back_n_forth(d) == d
         """
-        return cls.functor(
+        functor = cls.functor(
             ob=lambda typ: typ, ar=cls.from_box,
             dom=Category(old.ty_factory, type(old)),
-            cod=Category(old.ty_factory, cls))(old)
+            cod=Category(old.ty_factory, cls))
+        identity = cls.id(functor(old.dom))
+        parent = list(range(identity.n_spiders))
+        spider_types = list(identity.spider_types)
+        dom_wires = identity.wires[:len(identity.dom)]
+        scan = list(identity.wires[len(identity.dom):])
+        boxes, offsets, box_wires = [], [], []
+        # The number of ports of each root, counting the scan as outputs, so
+        # we can key the spiders without ports in the order of the functor:
+        # by layer, then by the first position they are glued to in the scan
+        # or, for the spiders inside a box, by their position in the box.
+        n_ports, scalars = [2] * len(parent), {}
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        def union(i, j):
+            root, other = sorted((find(i), find(j)))
+            if root != other:
+                parent[other] = root
+                n_ports[root] += n_ports[other]
+
+        for depth, layer in enumerate(old.inside):
+            position, dom_position, glued = 0, 0, []
+            for i, box_or_typ in enumerate(layer):
+                if not i % 2:
+                    position += len(functor(box_or_typ))
+                    dom_position += len(functor(box_or_typ))
+                    continue
+                box = functor(box_or_typ)
+                base, n_dom = len(parent), len(box.dom)
+                parent.extend(range(base, base + box.n_spiders))
+                spider_types.extend(box.spider_types)
+                n_ports.extend(box.n_spiders * [0])
+                ports = [base + k for k in box.wires[n_dom:]]
+                for spider in ports:
+                    n_ports[spider] += 1
+                for k in set(range(box.n_spiders)).difference(box.wires):
+                    scalars[base + k] = (depth, 1, base + k)
+                glued.extend(enumerate(
+                    scan[position:position + n_dom], dom_position))
+                for j, k in zip(scan[position:position + n_dom], box.wires):
+                    n_ports[find(j)] -= 1
+                    union(j, base + k)
+                dom_position += n_dom
+                n_boxes = len(ports) - len(box.cod)
+                boxes.extend(box.boxes)
+                offsets.extend(box.offsets)
+                box_wires.extend(ports[:n_boxes])
+                scan[position:position + n_dom] = ports[n_boxes:]
+                position += len(box.cod)
+            for dom_position, spider in glued:
+                if not n_ports[find(spider)]:
+                    scalars.setdefault(find(spider), (depth, 0, dom_position))
+        wires = tuple(map(find, chain(dom_wires, box_wires, scan)))
+        spider_types = {
+            scalars.get(find(i), find(i)): typ
+            for i, typ in enumerate(spider_types)}
+        return cls(
+            identity.dom, functor(old.cod), tuple(boxes), wires,
+            spider_types, tuple(offsets))
 
     def to_diagram(self, make_causal_first: bool = False) -> Diagram:
         """
@@ -924,48 +1213,45 @@ class Hypergraph(Composable, Whiskerable, NamedGeneric['category', 'functor']):
         v >> Swap(x, x) >> v[::-1]
         >>> print(x @ H.swap(x, x) >> v[::-1] @ x)
         x @ Swap(x, x) >> v[::-1] @ x
+
+        The result is computed once per hypergraph and order.
+
+        >>> assert v.to_diagram() is v.to_diagram()
         """
+        if make_causal_first not in self._diagrams:
+            self._diagrams[make_causal_first] = self._to_diagram(
+                make_causal_first)
+        return self._diagrams[make_causal_first]
+
+    @cached_property
+    def _diagrams(self) -> dict[bool, Diagram]:
+        """ The diagrams returned by :meth:`to_diagram` so far. """
+        return {}
+
+    def _to_diagram(self, make_causal_first: bool) -> Diagram:
         if not self.is_causal or not self.is_monogamous:
             if make_causal_first:
                 return self.make_causal().make_bijective().to_diagram()
             else:
                 return self.make_monogamous().make_causal().to_diagram()
+        layers, swaps = _plan_swaps(
+            self.wires, len(self.dom),
+            tuple((len(box.dom), len(box.cod)) for box in self.boxes),
+            tuple(self.offsets))
+
+        def permute(diagram, swaps):
+            for left, middle, right in swaps:
+                diagram >>= diagram.cod[:left] @ diagram.swap(
+                    diagram.cod[left:middle], diagram.cod[middle:right]
+                ) @ diagram.cod[right:]
+            return diagram
+
         diagram = self.category.ar.id(self.dom)
-        scan, n_ports = self.wires[:len(self.dom)], len(self.dom)
-        for depth, (box, offset) in enumerate(zip(self.boxes, self.offsets)):
-            for i, obj in enumerate(box.dom):
-                j = scan.index(self.wires[n_ports + i])
-                if i == 0 and offset is None:
-                    offset = j
-                elif j > offset + i:
-                    diagram >>= diagram.cod[:offset + i] @ diagram.swap(
-                        diagram.cod[offset + i:j], diagram.cod[j]
-                    ) @ diagram.cod[j + 1:]
-                    scan = (scan[:offset + i] + scan[j:j + 1]) + (
-                        scan[offset + i:j] + scan[j + 1:])
-                elif j < offset + i:
-                    diagram >>= diagram.cod[:j] @ diagram.swap(
-                        diagram.cod[j], diagram.cod[j + 1:offset + i]
-                    ) @ diagram.cod[offset + i:]
-                    scan = (scan[:j] + scan[j + 1:offset + i]) + (
-                        scan[j:j + 1] + scan[offset + i:])
-                    offset -= 1
-                assert len(scan) == len(diagram.cod)
-            offset = 0 if offset is None else offset
-            scan = scan[:offset] + self.wires[
-                n_ports + len(box.dom):n_ports + len(box.dom @ box.cod)
-            ] + scan[offset + len(box.dom):]
+        for box, (box_swaps, offset) in zip(self.boxes, layers):
+            diagram = permute(diagram, box_swaps)
             diagram >>= diagram.cod[:offset] @ box @ diagram.cod[
                 offset + len(box.dom):]
-            n_ports += len(box.dom @ box.cod)
-        for i, _ in enumerate(self.cod):
-            j = scan.index(self.wires[n_ports + i])
-            if i < j:
-                diagram >>= diagram.cod[:i] @ diagram.swap(
-                    diagram.cod[i:j], diagram.cod[j:j + 1]
-                ) @ diagram.cod[j + 1:]
-                scan = scan[:i] + scan[j:j + 1] + scan[i:j] + scan[j + 1:]
-        return diagram
+        return permute(diagram, swaps)
 
     @classmethod
     def from_callable(cls, dom: Ty, cod: Ty) -> Callable[Callable, Hypergraph]:
@@ -1064,34 +1350,35 @@ class Hypergraph(Composable, Whiskerable, NamedGeneric['category', 'functor']):
         outputs, boxes, domain, codomain and spiders.
         """
         graph = Graph()
-        graph.add_nodes_from(
+        spider_nodes = [
             Node("spider", i=i, obj=obj)
-            for i, obj in enumerate(self.spider_types))
+            for i, obj in enumerate(self.spider_types)]
+        graph.add_nodes_from(
+            (spider_node, dict(box=None)) for spider_node in spider_nodes)
         graph.add_nodes_from(
-            (Node("input", i=i, obj=obj), dict(i=i))
+            (Node("input", i=i, obj=obj), dict(i=i, box=None))
             for i, obj in enumerate(self.dom))
         graph.add_edges_from(
             (Node("input", i=i, obj=obj), Node("spider", i=j, obj=obj))
             for i, (j, obj) in enumerate(
                 zip(self.wires[:len(self.dom)], self.dom)))
+        nodes, edges = [], []
         for i, (box, (dom_wires, cod_wires)) in enumerate(
                 zip(self.boxes, self.box_wires)):
             box_node = Node("box", box=box, i=i)
-            graph.add_node(box_node, box=box)
+            nodes.append((box_node, dict(box=box)))
             for case, wires in [("dom", dom_wires), ("cod", cod_wires)]:
                 for j, spider in enumerate(wires):
-                    obj = self.spider_types[spider]
-                    spider_node = Node("spider", i=spider, obj=obj)
+                    spider_node = spider_nodes[spider]
                     port_node = Node(case, i=i, j=j)
-                    graph.add_node(port_node, j=j, box=None)
-                    if case == "dom":
-                        graph.add_edge(spider_node, port_node)
-                        graph.add_edge(port_node, box_node)
-                    else:
-                        graph.add_edge(box_node, port_node)
-                        graph.add_edge(port_node, spider_node)
+                    nodes.append((port_node, dict(j=j, box=None)))
+                    edges += [(spider_node, port_node), (port_node, box_node)]\
+                        if case == "dom" else [
+                            (box_node, port_node), (port_node, spider_node)]
+        graph.add_nodes_from(nodes)
+        graph.add_edges_from(edges)
         graph.add_nodes_from(
-            (Node("output", i=i, obj=obj), dict(i=i))
+            (Node("output", i=i, obj=obj), dict(i=i, box=None))
             for i, obj in enumerate(self.cod))
         graph.add_edges_from(
             (Node("spider", i=j, obj=obj), Node("output", i=i, obj=obj))
@@ -1100,8 +1387,23 @@ class Hypergraph(Composable, Whiskerable, NamedGeneric['category', 'functor']):
         return graph
 
     def depth(self) -> int:
-        """ The depth of a causal hypergraph. """
-        return dag_longest_path_length(self.make_causal().to_graph()) // 4
+        """
+        The depth of a causal hypergraph, i.e. the length of the longest path
+        in :meth:`to_graph` divided by four, the number of edges per box.
+
+        This is computed in one pass over the boxes in their causal order.
+        """
+        causal = self.make_causal()
+        box_lengths, spider_lengths = [], [1] * causal.n_spiders
+        for dom_wires, cod_wires in causal.box_wires:
+            length = max((spider_lengths[i] + 2 for i in dom_wires), default=0)
+            box_lengths.append(length)
+            for i in cod_wires:
+                spider_lengths[i] = length + 2
+        output_lengths = [spider_lengths[i] + 1 for i in causal.wires[
+            len(causal.wires) - len(causal.cod):]]
+        return max(chain(
+            box_lengths, spider_lengths, output_lengths), default=0) // 4
 
     def spring_layout(self, seed=None, k=None):
         """ Computes a layout using a force-directed algorithm. """
@@ -1131,10 +1433,74 @@ class Hypergraph(Composable, Whiskerable, NamedGeneric['category', 'functor']):
         pos = spring_layout(graph, pos=pos, fixed=fixed, k=k, seed=seed)
         return graph, pos
 
-    def draw(self, seed=None, k=.25, path=None):
+    def layered_layout(self):
+        """
+        Computes a deterministic layout with inputs at the top, outputs at the
+        bottom and each box one layer below the boxes it depends on.
+
+        Each spider sits just below the box that produces it, or at the top if
+        it is not produced by any box.
+
+        Example
+        -------
+        >>> from discopy.frobenius import Ty, Box, Hypergraph as H
+        >>> x = Ty('x')
+        >>> f = Box('f', x, x).to_hypergraph()
+        >>> graph, pos = (f >> f).layered_layout()
+        >>> for node in graph.nodes:
+        ...     if node.kind in ("input", "box", "output"):
+        ...         print(node.kind, pos[node])
+        input (0, 6)
+        box (0.0, 4)
+        box (0.0, 2)
+        output (0, 0)
+        """
+        graph = self.to_graph().to_undirected()
+        _, _, first_inputs, _ = self._spider_port_stats
+        producers = [
+            self._port_depths[port] if port < len(self.wires) else -1
+            for port in first_inputs]
+        levels = []
+        for depth, (dom_wires, _) in enumerate(self.box_wires):
+            levels.append(1 + max((
+                levels[producers[spider]] for spider in dom_wires
+                if 0 <= producers[spider] < depth), default=0))
+        height = 2 * max(levels, default=0) + 2
+        heights = [height - 2 * level for level in levels]
+        width = max(len(self.dom), len(self.cod), 1)
+        rows = {}
+        for i, box in enumerate(self.boxes):
+            rows.setdefault(heights[i], []).append(
+                Node("box", i=i, box=box))
+        for i, obj in enumerate(self.spider_types):
+            y = height if producers[i] < 0 else heights[producers[i]]
+            rows.setdefault(y - 1, []).append(Node("spider", i=i, obj=obj))
+        pos = {}
+        for y, nodes in rows.items():
+            for j, node in enumerate(nodes):
+                pos[node] = (j - (len(nodes) - width) / 2, y)
+        for i, (dom_wires, cod_wires) in enumerate(self.box_wires):
+            box_node = Node("box", i=i, box=self.boxes[i])
+            for kind, wires in [("dom", dom_wires), ("cod", cod_wires)]:
+                for j, _ in enumerate(wires):
+                    pos[Node(kind, i=i, j=j)] = pos[box_node]
+        for i, obj in enumerate(self.dom):
+            pos[Node("input", i=i, obj=obj)] = (i, height)
+        for i, obj in enumerate(self.cod):
+            pos[Node("output", i=i, obj=obj)] = (i, 0)
+        return graph, pos
+
+    def draw(self, seed=None, k=.25, path=None, layout="spring"):
         """
         Draw a hypegraph using a force-based layout algorithm.
 
+        Parameters:
+            seed : The random seed for the spring layout.
+            k : The optimal distance between nodes in the spring layout.
+            path : Where to save the drawing, if any.
+            layout : Either ``"spring"`` for :meth:`spring_layout` or
+                ``"layered"`` for :meth:`layered_layout`.
+
         Examples
         --------
         >>> from discopy.frobenius import Ty, Box, Hypergraph as H
@@ -1152,7 +1518,8 @@ class Hypergraph(Composable, Whiskerable, NamedGeneric['category', 'functor']):
         .. image:: /_static/hypergraph/diagram.png
             :align: center
         """
-        graph, pos = self.spring_layout(seed=seed, k=k)
+        graph, pos = self.spring_layout(seed=seed, k=k)\
+            if layout == "spring" else self.layered_layout()
         for i, (box, (dom_wires, cod_wires)) in enumerate(
                 zip(self.boxes, self.box_wires)):
             box_node = Node("box", i=i, box=box)
@@ -1170,7 +1537,7 @@ class Hypergraph(Composable, Whiskerable, NamedGeneric['category', 'functor']):
             for node in graph.nodes}
         nodelist = list(graph.nodes)
         node_size = [
-            300 if node.kind in ["spider", "box"] else 0 for node in nodelist]
+            300 if node.kind in ("spider", "box") else 0 for node in nodelist]
         draw_networkx(
             graph, pos=pos, labels=labels,
             nodelist=nodelist, node_size=node_size,
@@ -530,6 +530,10 @@ class Diagram(cat.Arrow, Whiskerable):
         if other is None:
             return self
         if others:
+            diagrams = (self, other) + others
+            if all(isinstance(diagram, Diagram)
+                   and not isinstance(diagram, Sum) for diagram in diagrams):
+                return self._tensor_many(other, *others)
             return self.tensor(other).tensor(*others)
         if isinstance(other, Sum):
             return self.sum_factory((self, )).tensor(other)
@@ -540,6 +544,25 @@ class Diagram(cat.Arrow, Whiskerable):
         dom, cod = self.dom @ other.dom, self.cod @ other.cod
         return self.factory(inside, dom, cod, _scan=False)
 
+    def _tensor_many(self, *others: Diagram) -> Diagram:
+        """
+        Tensor of more than two diagrams, computed in one pass so that each
+        layer gets whiskered once rather than once per diagram on its right.
+        """
+        diagrams = (self, ) + others
+        for other in others:
+            assert_isinstance(other, self.factory)
+            assert_isinstance(self, other.factory)
+        rights = [self.dom[:0]]
+        for diagram in reversed(others):
+            rights.append(diagram.dom @ rights[-1])
+        inside, left = (), self.cod[:0]
+        for diagram, right in zip(diagrams, reversed(rights)):
+            inside += tuple(left @ layer @ right for layer in diagram.inside)
+            left = left @ diagram.cod
+        dom = self.dom.tensor(*(diagram.dom for diagram in others))
+        return self.factory(inside, dom, left, _scan=False)
+
     @property
     def boxes(self) -> list[Box]:
         """ The boxes in each layer of the diagram. """
@@ -17,8 +17,11 @@ Summary
 
 """
 
+from itertools import chain
+
 from discopy.matrix import get_backend
 from discopy.quantum.circuit import qubit, Circuit, Id
+from discopy.quantum.gates import H, Rx, Ry, Rz, CRz
 
 
 def IQPansatz(n_qubits, params) -> Circuit:
@@ -36,16 +39,16 @@ def IQPansatz(n_qubits, params) -> Circuit:
     >>> print(IQPansatz(1, [0.3, 0.8, 0.4]))
     Rx(0.3) >> Rz(0.8) >> Rx(0.4)
     """
-    from discopy.quantum.gates import H, Rx, Rz, CRz
-
     np = get_backend()
+    Layer = Circuit.layer_factory
+    hadamards = _wall(n_qubits, n_qubits * [H])
+
+    wires = qubit ** n_qubits
 
     def layer(thetas):
-        hadamards = Id().tensor(*(n_qubits * [H]))
-        rotations = Id(qubit ** n_qubits).then(*(
-            qubit ** i @ CRz(thetas[i]) @ qubit ** (n_qubits - 2 - i)
-            for i in range(n_qubits - 1)))
-        return hadamards >> rotations
+        return hadamards + tuple(
+            Layer(wires[:i], CRz(thetas[i]), wires[i + 2:])
+            for i in range(n_qubits - 1))
     if n_qubits == 1:
         circuit = Rx(params[0]) >> Rz(params[1]) >> Rx(params[2])
     elif len(np.shape(params)) != 2\
@@ -54,7 +57,7 @@ def IQPansatz(n_qubits, params) -> Circuit:
             f"Expected params of shape (depth, {n_qubits - 1})")
     else:
         depth = np.shape(params)[0]
-        circuit = Id(qubit ** n_qubits).then(*(
+        circuit = _from_layers(n_qubits, chain.from_iterable(
             layer(params[i]) for i in range(depth)))
     return circuit
 
@@ -79,28 +82,26 @@ def Sim14ansatz(n_qubits, params) -> Circuit:
     >>> print(Sim14ansatz(1, [0.1, 0.2, 0.3]))
     Rx(0.1) >> Rz(0.2) >> Rx(0.3)
     """
-    from discopy.quantum.gates import Rx, Ry, Rz
-
     np = get_backend()
+    wires = Id(qubit ** n_qubits)
 
     def layer(thetas):
-        sublayer1 = Id().tensor(
-            *([Ry(theta) for theta in thetas[:n_qubits]]))
+        sublayer1 = _wall(n_qubits, map(Ry, thetas[:n_qubits]))
 
         for i in range(n_qubits):
             src = i
             tgt = (i - 1) % n_qubits
-            sublayer1 = sublayer1.CRx(thetas[n_qubits + i], src, tgt)
+            sublayer1 += wires.CRx(thetas[n_qubits + i], src, tgt).inside
 
-        sublayer2 = Id().tensor(
-            *([Ry(theta) for theta in thetas[2 * n_qubits: 3 * n_qubits]]))
+        sublayer2 = _wall(
+            n_qubits, map(Ry, thetas[2 * n_qubits: 3 * n_qubits]))
 
         for i in range(n_qubits, 0, -1):
             src = i % n_qubits
             tgt = (i + 1) % n_qubits
-            sublayer2 = sublayer2.CRx(thetas[-i], src, tgt)
+            sublayer2 += wires.CRx(thetas[-i], src, tgt).inside
 
-        return sublayer1 >> sublayer2
+        return sublayer1 + sublayer2
 
     params_shape = np.shape(params)
 
@@ -111,7 +112,7 @@ def Sim14ansatz(n_qubits, params) -> Circuit:
             f"Expected params of shape (depth, {4 * n_qubits})")
     else:
         depth = params_shape[0]
-        circuit = Id(qubit ** n_qubits).then(*(
+        circuit = _from_layers(n_qubits, chain.from_iterable(
             layer(params[i]) for i in range(depth)))
 
     return circuit
@@ -137,28 +138,25 @@ def Sim15ansatz(n_qubits, params) -> Circuit:
     >>> print(Sim15ansatz(1, [0.1, 0.2, 0.3]))
     Rx(0.1) >> Rz(0.2) >> Rx(0.3)
     """
-    from discopy.quantum.gates import Rx, Ry, Rz
-
     np = get_backend()
+    wires = Id(qubit ** n_qubits)
 
     def layer(thetas):
-        sublayer1 = Id().tensor(
-            *([Ry(theta) for theta in thetas[:n_qubits]]))
+        sublayer1 = _wall(n_qubits, map(Ry, thetas[:n_qubits]))
 
         for i in range(n_qubits):
             src = i
             tgt = (i - 1) % n_qubits
-            sublayer1 = sublayer1.CX(src, tgt)
+            sublayer1 += wires.CX(src, tgt).inside
 
-        sublayer2 = Id().tensor(
-            *([Ry(theta) for theta in thetas[n_qubits:]]))
+        sublayer2 = _wall(n_qubits, map(Ry, thetas[n_qubits:]))
 
         for i in range(n_qubits, 0, -1):
             src = i % n_qubits
             tgt = (i + 1) % n_qubits
-            sublayer2 = sublayer2.CX(src, tgt)
+            sublayer2 += wires.CX(src, tgt).inside
 
-        return sublayer1 >> sublayer2
+        return sublayer1 + sublayer2
 
     params_shape = np.shape(params)
 
@@ -169,7 +167,20 @@ def Sim15ansatz(n_qubits, params) -> Circuit:
             f"Expected params of shape (depth, {2 * n_qubits})")
     else:
         depth = params_shape[0]
-        circuit = Id(qubit ** n_qubits).then(*(
+        circuit = _from_layers(n_qubits, chain.from_iterable(
             layer(params[i]) for i in range(depth)))
 
     return circuit
+
+
+def _wall(n_qubits, gates) -> tuple:
+    """ The layers of a tensor of single-qubit gates, one gate per layer. """
+    Layer, wires = Circuit.layer_factory, qubit ** n_qubits
+    return tuple(
+        Layer(wires[:i], gate, wires[i + 1:]) for i, gate in enumerate(gates))
+
+
+def _from_layers(n_qubits, layers) -> Circuit:
+    """ The circuit on n qubits with the given layers inside. """
+    return Circuit(tuple(layers), qubit ** n_qubits, qubit ** n_qubits,
+                   _scan=False)
@@ -70,11 +70,13 @@ Examples
 from __future__ import annotations
 
 from collections.abc import Mapping
+from copy import deepcopy
+from functools import cached_property, reduce
 from math import pi
 
 from discopy import messages, rigid, tensor, frobenius
 from discopy.cat import factory, Category
-from discopy.matrix import backend
+from discopy.matrix import backend, get_backend
 from discopy.tensor import Dim, Tensor
 from discopy.utils import factory_name, assert_isinstance
 
@@ -184,7 +186,7 @@ class Circuit(tensor.Diagram):
         dom = qubit ** dom if isinstance(dom, int) else dom
         return tensor.Diagram.id.__func__(Circuit, dom)
 
-    @property
+    @cached_property
     def is_mixed(self):
         """
         Whether the circuit is mixed, i.e. it contains both bits and qubits
@@ -193,24 +195,34 @@ class Circuit(tensor.Diagram):
         Mixed circuits can be evaluated only by a
         :class:`ChannelFunctor` not a :class:`discopy.tensor.Functor`.
         """
-        both_bits_and_qubits = self.dom.count(bit) and self.dom.count(qubit)\
-            or any(layer.cod.count(bit) and layer.cod.count(qubit)
-                   for layer in self.inside)
-        return both_bits_and_qubits or any(box.is_mixed for box in self.boxes)
+        def both_bits_and_qubits(typ):
+            return bit.inside[0] in typ.inside\
+                and qubit.inside[0] in typ.inside
+        return both_bits_and_qubits(self.dom)\
+            or any(both_bits_and_qubits(layer.cod) for layer in self.inside)\
+            or any(box.is_mixed for box in self.boxes)
 
     def init_and_discard(self):
         """ Returns a circuit with empty domain and only bits as codomain. """
         from discopy.quantum.gates import Bits, Ket, Discard
-        circuit = self
+        Layer, circuit = self.layer_factory, self
         if circuit.dom:
-            init = Id().tensor(*(
-                Bits(0) if x.name == "bit" else Ket(0) for x in circuit.dom))
-            circuit = init >> circuit
+            boxes = [Bits(0) if x.name == "bit" else Ket(0)
+                     for x in circuit.dom]
+            cod = Ty().tensor(*(box.cod for box in boxes))
+            inside = tuple(
+                Layer(cod[:i], box, cod[:0]) for i, box in enumerate(boxes))
+            circuit = Circuit(inside, cod[:0], cod, _scan=False) >> circuit
         if circuit.cod != bit ** len(circuit.cod):
-            discards = Id().tensor(*(
-                Discard() if x.name == "qubit"
-                else Id(bit) for x in circuit.cod))
-            circuit = circuit >> discards
+            inside, n_bits = [], 0
+            for i, x in enumerate(circuit.cod):
+                if x.name == "qubit":
+                    inside.append(Layer(
+                        bit ** n_bits, Discard(), circuit.cod[i + 1:]))
+                else:
+                    n_bits += 1
+            circuit = circuit >> Circuit(
+                tuple(inside), circuit.cod, bit ** n_bits)
         return circuit
 
     def eval(self, *others, backend=None, mixed=False,
@@ -230,7 +242,9 @@ class Circuit(tensor.Diagram):
             or :class:`ChannelFunctor`.
         contractor : callable, optional
             Use :class:`tensornetwork` contraction
-            instead of discopy's basic eval feature.
+            instead of discopy's basic eval feature, e.g.
+            :code:`tensornetwork.contractors.auto` which finds a contraction
+            path with :code:`opt_einsum` rather than contracting gate by gate.
         params : kwargs, optional
             Get passed to Circuit.get_counts.
 
@@ -264,6 +278,18 @@ class Circuit(tensor.Diagram):
         >>> circuit = Bits(1, 0) @ Ket(0) >> Discard(bit ** 2 @ qubit)
         >>> assert circuit.eval() == Channel(dom=CQ(), cod=CQ(), array=[1])
 
+        We can also contract a circuit as a tensor network, with the
+        contraction path optimised by :code:`opt_einsum`, this works for
+        both pure and mixed circuits:
+
+        >>> from tensornetwork.contractors import auto
+        >>> bell_state = Ket(0, 0) >> H @ qubit >> CX
+        >>> assert bell_state.eval(contractor=auto).round(2)\\
+        ...     == bell_state.eval().round(2)
+        >>> bell_test = bell_state >> Measure() @ Measure()
+        >>> assert bell_test.eval(contractor=auto).round(2)\\
+        ...     == bell_test.eval().round(2)
+
         We can execute any circuit on a `pytket.Backend` and get a
         :class:`discopy.tensor.Tensor` of real-valued probabilities.
 
@@ -290,8 +316,6 @@ class Circuit(tensor.Diagram):
                 dtype=complex, dom=Category(Ty, Circuit))
             return Tensor[complex](array, f(self.dom), f(self.cod))
 
-        from discopy.quantum import channel
-        from discopy.quantum.gates import Bits
         if backend is None:
             if others:
                 return [circuit.eval(mixed=mixed, **params)
@@ -361,10 +385,9 @@ class Circuit(tensor.Diagram):
                 return [circuit.get_counts(**params)
                         for circuit in (self, ) + others]
             result, counts = self.init_and_discard().eval(mixed=True), dict()
-            for i in range(2 ** len(result.cod.classical)):
-                bits = index2bitstring(i, len(result.cod.classical))
-                if result.array[bits]:
-                    counts[bits] = result.array[bits].real
+            for index in get_backend().argwhere(result.array):
+                bits = tuple(map(int, index))
+                counts[bits] = result.array[bits].real
             return counts
         counts = self.to_tk().get_counts(
             *(other.to_tk() for other in others), backend=backend, **params)
@@ -383,18 +406,13 @@ class Circuit(tensor.Diagram):
         -------
         array : numpy.ndarray
         """
-        from discopy.quantum.gates import Bra, Ket
+        from discopy.quantum.gates import Ket
         if mixed or self.is_mixed:
             return self.init_and_discard().eval(mixed=True).array.real
         state = (Ket(*(len(self.dom) * [0])) >> self).eval()
-        effects = [Bra(*index2bitstring(j, len(self.cod))).eval()
-                   for j in range(2 ** len(self.cod))]
         with backend() as np:
-            array = np.zeros(len(self.cod) * (2, )) + 0j
-            for effect in effects:
-                array +=\
-                    effect.array * np.absolute((state >> effect).array) ** 2
-        return array
+            probabilities = np.absolute(state.array) ** 2 + 0j
+            return probabilities.reshape(len(self.cod) * (2, ))
 
     def to_tn(self, mixed=False):
         """
@@ -555,6 +573,12 @@ class Circuit(tensor.Diagram):
         >>> print(repr(circuit3.to_tk()))
         tk.Circuit(2, 1).H(0).X(1).CX(0, 1).Measure(1, 0).post_select({0: 0})
         """
+        return deepcopy(self._tk_circuit)
+
+    @cached_property
+    def _tk_circuit(self):
+        # Circuits are immutable but t|ket> circuits are not, e.g. they get
+        # measured or compiled in place, hence ``to_tk`` returns a copy.
         from discopy.quantum.tk import to_tk
         return to_tk(self)
 
@@ -829,7 +853,7 @@ class Box(tensor.Box, Circuit):
 
 class Sum(tensor.Sum, Box):
     """ Sums of circuits. """
-    @property
+    @cached_property
     def is_mixed(self):
         return any(circuit.is_mixed for circuit in self.terms)
 
@@ -846,13 +870,16 @@ class Sum(tensor.Sum, Box):
         return result
 
     def eval(self, backend=None, mixed=False, **params):
-        mixed = mixed or any(t.is_mixed for t in self.terms)
+        mixed = mixed or self.is_mixed
         if not self.terms:
             return 0
         if len(self.terms) == 1:
             return self.terms[0].eval(backend=backend, mixed=mixed, **params)
-        return sum(
-            Circuit.eval(*self.terms, backend=backend, mixed=mixed, **params))
+        results = Circuit.eval(
+            *self.terms, backend=backend, mixed=mixed, **params)
+        np = get_backend()
+        array = np.sum(np.stack([result.array for result in results]), 0)
+        return type(results[0])(array, results[0].dom, results[0].cod)
 
     def grad(self, var, **params):
         return sum(circuit.grad(var, **params) for circuit in self.terms)
@@ -903,7 +930,7 @@ def index2bitstring(i: int, length: int) -> tuple[int, ...]:
 
 def bitstring2index(bitstring):
     """ Turns a bitstring into an index. """
-    return sum(value * 2 ** i for i, value in enumerate(bitstring[::-1]))
+    return reduce(lambda index, value: index << 1 | value, bitstring, 0)
 
 
 Circuit.braid_factory, Circuit.sum_factory = Swap, Sum
@@ -299,10 +299,10 @@ def to_tk(circuit):
             qubits = qubits[:left.count(qubit)]\
                 + qubits[left.count(qubit) + box.dom.count(qubit):]
         elif isinstance(box, Swap):
-            if box == Swap(qubit, qubit):
+            if box.dom == qubit ** 2:
                 off = left.count(qubit)
                 swap(qubits[off], qubits[off + 1])
-            elif box == Swap(bit, bit):
+            elif box.dom == bit ** 2:
                 off = left.count(bit)
                 if tk_circ.post_processing:
                     right = Id(tk_circ.post_processing.cod[off + 2:])
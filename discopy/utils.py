@@ -27,7 +27,6 @@ from typing import (
 
 import json
 from functools import wraps
-from networkx import Graph, connected_components
 from matplotlib.testing.compare import compare_images
 
 from discopy import messages
@@ -371,7 +370,8 @@ def pushout(
         left_boundary: Collection[int], right_boundary: Collection[int]) \
         -> Pushout:
     """
-    Computes the pushout of two finite mappings using connected components.
+    Computes the pushout of two finite mappings using a union-find on the
+    boundary, i.e. the connected components of the span.
 
     Parameters:
         left : The size of the left set.
@@ -379,25 +379,38 @@ def pushout(
         left_boundary : The mapping from boundary to left.
         right_boundary : The mapping from boundary to right.
 
+    Note
+    ----
+    The components are numbered in order of their first boundary element.
+
     Examples
     --------
     >>> assert pushout(2, 3, [1], [0]) == ({0: 0, 1: 1}, {0: 1, 1: 2, 2: 3})
     """
     if len(left_boundary) != len(right_boundary):
         raise ValueError
-    components, left_pushout, right_pushout = set(), {}, {}
+    parent = list(range(len(left_boundary)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for boundary in (left_boundary, right_boundary):
+        first = {}
+        for i, j in enumerate(boundary):
+            root, other = find(first.setdefault(j, i)), find(i)
+            parent[max(root, other)] = min(root, other)
+    components = {}
+    for i in range(len(left_boundary)):
+        components.setdefault(find(i), len(components))
+    left_pushout, right_pushout = {}, {}
     left_proper = sorted(set(range(left)) - set(left_boundary))
     left_pushout.update({j: i for i, j in enumerate(left_proper)})
-    graph = Graph([
-        (("middle", i), ("left", j)) for i, j in enumerate(left_boundary)] + [
-        (("middle", i), ("right", j)) for i, j in enumerate(right_boundary)])
-    for i, component in enumerate(connected_components(graph)):
-        components.add(i)
-        for case, j in component:
-            if case == "left":
-                left_pushout[j] = len(left_proper) + i
-            if case == "right":
-                right_pushout[j] = len(left_proper) + i
+    for i, (j, k) in enumerate(zip(left_boundary, right_boundary)):
+        left_pushout[j] = right_pushout[k]\
+            = len(left_proper) + components[find(i)]
     right_proper = set(range(right)) - set(right_boundary)
     right_pushout.update({
         j: len(left_proper) + len(components) + i
@@ -20,6 +20,9 @@ def test_eager_parse():
     Bob = Word('Bob', n)
     grammar = Cup(n, n.r) @ Id(s) @ Cup(n.l, n)
     assert eager_parse(Alice, loves, Bob) == grammar << Alice @ loves @ Bob
+    red_Alice = Word('Alice', n, color='red')
+    assert red_Alice == Alice
+    assert eager_parse(red_Alice, loves, Bob).boxes[0] is red_Alice
     who = Word('who', n.r @ n @ s.l @ n)
     assert eager_parse(Bob, who, loves, Alice, target=n).offsets ==\
         [0, 1, 5, 8, 0, 2, 1, 1]
@@ -43,6 +46,10 @@ def test_brute_force():
     gen = brute_force(Alice, loves, Bob, target=n)
     assert next(gen) == Word('Alice', Ty('n'))
     assert next(gen) == Word('Bob', Ty('n'))
+    x = Word('x', n.r @ n @ n.r)
+    gen = brute_force(Alice, x, target=n @ n.r)
+    assert next(gen) == eager_parse(Alice, x, target=n @ n.r)
+    assert not list(brute_force(Alice, Bob))
 
 
 def test_normal_form():
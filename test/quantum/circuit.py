@@ -201,6 +201,7 @@ def test_Circuit_conjugate():
 def test_Circuit_measure():
     assert Id().measure() == 1
     assert all(Bits(0).measure(mixed=True) == np.array([1, 0]))
+    assert np.allclose((H @ X >> CX).measure(), [[0, .5], [.5, 0]])
 
 
 def test_Box():
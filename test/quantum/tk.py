@@ -29,6 +29,9 @@ def test_Circuit_to_tk():
     assert repr((Bits(0) >> Id(bit) @ Bits(0)).to_tk())\
         == "tk.Circuit(0, 2)"
     assert "Swap" in repr((Bra(0) @ Bits(0) >> Bits(0) @ Id(bit)).to_tk())
+    circuit = H >> Measure()
+    circuit.to_tk().scale(2).measure_all()
+    assert repr(circuit.to_tk()) == "tk.Circuit(1, 1).H(0).Measure(0, 0)"
 
 
 def test_Sum_from_tk():
@@ -1,7 +1,7 @@
 from pytest import raises
 
 from discopy.hypergraph import *
-from discopy.frobenius import Ty, Box, Cap, Hypergraph as H
+from discopy.frobenius import Ty, Box, Cap, Cup, Spider, Hypergraph as H
 
 def test_pushout():
     with raises(ValueError):
@@ -51,9 +51,39 @@ def test_Hypergraph_bijection():
         H.spiders(1, 2, Ty('x')).bijection
 
 
+def test_Hypergraph_make_bijective():
+    x, y = map(Ty, "xy")
+    spiders = H.spiders(1, 6, x) @ H.spiders(1, 2, y)
+    assert spiders.make_bijective().is_causal
+
+
+def test_Hypergraph_make_polygynous():
+    x = Ty('x')
+    f = Box('f', x, x @ x)
+    h = (f.to_hypergraph() >> H.spiders(2, 1, x)).make_polygynous()
+    assert h.boxes == (f, Spider(2, 1, x)) and h.is_polygynous
+
+
 def test_Box():
     box = Box('box', Ty('x'), Ty('y')).to_hypergraph()
     assert box == box and box == box @ H.id() and box != 1
+    assert box != H.spiders(1, 1, Ty('x')) >> H.id(Ty('x'))
+    assert H.id(Ty('x')) != H.id(Ty('y'))
+
+
+def test_Hypergraph_hash():
+    x = Ty('x')
+    f = Box('f', Ty(), x).to_hypergraph()
+    g = Box('g', x, Ty()).to_hypergraph()
+    assert hash(f >> g) == hash((f >> g).interchange(0, 1))
+    assert len({f >> H.spiders(1, 2, x), f >> H.spiders(1, 2, x)}) == 1
+    y, z = Ty('y'), Ty('z')
+    f, g = Box('f', x, z), Box('g', x, y)
+    h = H(x @ x, z @ y, (f, g), (0, 1, 0, 2, 1, 3, 2, 3))
+    permuted = H(x @ x, z @ y, (g, f), (3, 2, 2, 0, 3, 1, 1, 0))
+    swapped = H(x @ x, z @ y, (f, g), (1, 0, 0, 2, 1, 3, 2, 3))
+    assert h == permuted and hash(h) == hash(permuted)
+    assert h != swapped and hash(h) != hash(swapped)
 
 
 def test_AxiomError():
@@ -71,3 +101,17 @@ def test_cups():
     assert H.caps(x, x).make_monogamous().dagger()\
         == H.cups(x, x).make_monogamous()
     assert H.caps(x, x).to_diagram() == Cap(x, x)
+
+
+def test_Hypergraph_from_diagram():
+    x, y = map(Ty, "xy")
+    loops = Cap(x, x) >> Cap(y, y) @ x @ x >> Cup(y, y) @ x @ x >> Cup(x, x)
+    assert H.from_diagram(loops).spider_types == (y, x)
+
+
+def test_Hypergraph_layered_layout():
+    x = Ty('x')
+    h = H.spiders(2, 2, x) >> Box('f', x, x).to_hypergraph() @ x
+    graph, pos = h.layered_layout()
+    assert set(pos) == set(graph.nodes)
+    h.draw(layout="layered")
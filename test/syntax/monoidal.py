@@ -159,6 +159,10 @@ def test_Diagram_str():
 def test_Diagram_matmul():
     assert Id(Ty('x')) @ Id(Ty('y')) == Id(Ty('x', 'y'))
     assert Id(Ty('x')) @ Id(Ty('y')) == Id(Ty('x')).tensor(Id(Ty('y')))
+    x, y, z = Ty('x'), Ty('y'), Ty('z')
+    f, g, h = Box('f', x, y), Box('g', y @ z, Ty()), Box('h', Ty(), x)
+    assert f.tensor(g, h, f) == f @ g @ h @ f
+    assert Id(Ty()).tensor(h, f >> f.dagger(), g) == h @ (f >> f.dagger()) @ g
 
 
 def test_Diagram_interchange():